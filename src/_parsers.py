@@ -0,0 +1,166 @@
+"""Entry records and the row-to-entry hot loop, shared by every section.
+
+This module is deliberately free of Playwright/aiohttp/asyncio imports:
+it is the CPU-bound part of the scrape, and keeping it self-contained
+means it can be compiled as-is with Cython (``cythonize -i
+src/_parsers.py``) for extra headroom on large scrapes. The interpreted
+version runs whenever no compiled extension is present.
+"""
+
+from dataclasses import dataclass, field
+
+
+@dataclass(slots=True)
+class GameDataEntry:
+    """Base record; empty fields are dropped on serialization.
+
+    to_dict is hand-written per subclass instead of going through
+    dataclasses.asdict, which recursively deep-copies every value
+    before we throw the empty ones away again; unrolled attribute
+    reads and branches beat building and filtering a pairs tuple on
+    every entry.
+    """
+
+    type: str = ""
+    en: str = ""
+    jp: str = ""
+    notes: str = ""
+
+    def to_dict(self):
+        d = {"type": self.type, "en": self.en}
+        if self.jp:
+            d["jp"] = self.jp
+        if self.notes:
+            d["notes"] = self.notes
+        return d
+
+
+@dataclass(slots=True)
+class Monster(GameDataEntry):
+    type: str = "monster"
+    weakness: list = field(default_factory=list)
+    materials: list = field(default_factory=list)
+
+    def to_dict(self):
+        d = {"type": self.type, "en": self.en}
+        if self.jp:
+            d["jp"] = self.jp
+        if self.notes:
+            d["notes"] = self.notes
+        if self.weakness:
+            d["weakness"] = self.weakness
+        if self.materials:
+            d["materials"] = self.materials
+        return d
+
+
+@dataclass(slots=True)
+class Weapon(GameDataEntry):
+    type: str = "weapon"
+    weapon_type: str = ""
+    materials: list = field(default_factory=list)
+
+    def to_dict(self):
+        d = {"type": self.type, "en": self.en}
+        if self.jp:
+            d["jp"] = self.jp
+        if self.notes:
+            d["notes"] = self.notes
+        if self.weapon_type:
+            d["weapon_type"] = self.weapon_type
+        if self.materials:
+            d["materials"] = self.materials
+        return d
+
+
+@dataclass(slots=True)
+class Armor(GameDataEntry):
+    type: str = "armor"
+    skills: list = field(default_factory=list)
+    materials: list = field(default_factory=list)
+
+    def to_dict(self):
+        d = {"type": self.type, "en": self.en}
+        if self.jp:
+            d["jp"] = self.jp
+        if self.notes:
+            d["notes"] = self.notes
+        if self.skills:
+            d["skills"] = self.skills
+        if self.materials:
+            d["materials"] = self.materials
+        return d
+
+
+@dataclass(slots=True)
+class Skill(GameDataEntry):
+    type: str = "skill"
+    description: str = ""
+
+    def to_dict(self):
+        d = {"type": self.type, "en": self.en}
+        if self.jp:
+            d["jp"] = self.jp
+        if self.notes:
+            d["notes"] = self.notes
+        if self.description:
+            d["description"] = self.description
+        return d
+
+
+@dataclass(slots=True)
+class Item(GameDataEntry):
+    type: str = "item"
+    description: str = ""
+
+    def to_dict(self):
+        d = {"type": self.type, "en": self.en}
+        if self.jp:
+            d["jp"] = self.jp
+        if self.notes:
+            d["notes"] = self.notes
+        if self.description:
+            d["description"] = self.description
+        return d
+
+
+def _first_key(raw, *keys):
+    """Return the first truthy value among alternative JSON key names."""
+    for key in keys:
+        value = raw.get(key)
+        if value:
+            return value
+    return ""
+
+
+def entry_from_json(section_name, raw):
+    en = _first_key(raw, "en", "name_en", "name")
+    jp = _first_key(raw, "jp", "name_jp")
+    if section_name == "monsters":
+        return Monster(en=en, jp=jp,
+                       weakness=list(raw.get("weakness") or []),
+                       materials=list(raw.get("materials") or []))
+    if section_name == "weapons":
+        return Weapon(en=en, jp=jp,
+                      weapon_type=_first_key(raw, "weapon_type", "category"),
+                      materials=list(raw.get("materials") or []))
+    if section_name == "armor":
+        return Armor(en=en, jp=jp,
+                     skills=list(raw.get("skills") or []),
+                     materials=list(raw.get("materials") or []))
+    if section_name == "skills":
+        return Skill(en=en, jp=jp,
+                     description=_first_key(raw, "description", "desc"))
+    return Item(en=en, jp=jp,
+                description=_first_key(raw, "description", "desc"))
+
+
+def build_entries(section_name, rows):
+    """Map raw row dicts to entries, dropping rows without a name."""
+    entries = []
+    append = entries.append
+    for raw in rows:
+        entry = entry_from_json(section_name, raw)
+        if entry.en:
+            append(entry)
+    return entries
@@ -0,0 +1,560 @@
+#!/usr/bin/env python3
+"""Alternative mhn.quest scraper: rendered HTML in, BeautifulSoup out.
+
+Sibling to scrape_mhn_quest.py. That one extracts from the live DOM;
+this one pulls each section's rendered HTML out of the browser and
+parses it as a string, which keeps the parsers runnable offline against
+saved debug pages.
+"""
+
+import argparse
+import asyncio
+import hashlib
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import httpx
+import orjson
+import soupsieve as sv
+from bs4 import BeautifulSoup, FeatureNotFound
+from playwright.async_api import TimeoutError as PlaywrightTimeout
+from playwright.async_api import async_playwright
+
+try:
+    from lxml import html as lxml_html
+    from lxml.etree import XPath
+
+    # Compiled once: each call is a single C-level traversal, with no
+    # per-row Python tree walking. Class tests are token-exact (XPath
+    # contains() is a substring match that would also grab containers
+    # like .card-grid). The specific selector runs first; the generic
+    # card net applies only when it finds nothing, same as the
+    # _ITEM_SEL/_FALLBACK_SEL order on the BeautifulSoup path.
+    MONSTER_XPATH = XPath(
+        ".//div[contains(concat(' ', normalize-space(@class), ' '),"
+        " ' monster-card ')]")
+    MONSTER_FALLBACK_XPATH = XPath(
+        ".//div[contains(concat(' ', normalize-space(@class), ' '),"
+        " ' card ')]")
+    WEAKNESS_XPATH = XPath(".//img[contains(@class, 'weak')]/@alt")
+except ImportError:
+    lxml_html = None
+
+CONFIG = {
+    "base_url": "https://mhn.quest",
+    "output_dir": "output",
+    "timeouts": {"normal": 3000, "debug": 8000},
+    "sections": {
+        "monsters": {
+            "url_suffix": "/#/monster",
+            "container_selector": ".monster-list, .card-grid, main",
+            "item_selector": "div.monster-card, div.card",
+        },
+        "weapons": {
+            "url_suffix": "/#/weapon",
+            "container_selector": ".weapon-list, .card-grid, main",
+            "item_selector": "div.weapon-card, div.card",
+        },
+        "armor": {
+            "url_suffix": "/#/armor",
+            "container_selector": ".armor-list, .card-grid, main",
+            "item_selector": "div.armor-card, div.card",
+        },
+        "skills": {
+            "url_suffix": "/#/skill",
+            "container_selector": ".skill-list, .card-grid, main",
+            "item_selector": "div.skill-card, div.card",
+        },
+        "items": {
+            "url_suffix": "/#/item",
+            "container_selector": ".item-list, .card-grid, main",
+            "item_selector": "div.item-card, div.card",
+        },
+    },
+}
+
+
+# soup.select() re-parses its selector string on every call; compiling
+# each selector once here turns that into a dict lookup per parse.
+_ITEM_SEL = {key: sv.compile(section["item_selector"])
+             for key, section in CONFIG["sections"].items()}
+_NAME_SEL = sv.compile("h3, .name")
+_DESC_SEL = sv.compile("p, .description")
+# Runs once per section page inside the browser: map each item node to
+# its name, description and weakness alts there, so a small JSON array
+# crosses the protocol instead of the whole serialized DOM.
+_JS_EXTRACT = """
+els => els.map(el => {
+    const nameEl = el.querySelector('h3, .name');
+    const descEl = el.querySelector('p, .description');
+    const nameText = nameEl ? nameEl.innerText
+        : ((el.firstChild && el.firstChild.textContent) || '');
+    return {
+        name: nameText.trim(),
+        description: descEl ? descEl.innerText.trim() : '',
+        weaknesses: Array.from(el.querySelectorAll('img.weak, img.weakness'))
+            .map(img => (img.alt || '').trim())
+            .filter(Boolean),
+    };
+})
+"""
+
+# Broad "any card-ish div" net for when the section selector misses;
+# an attribute-substring match the compiled matcher evaluates directly,
+# instead of find_all() dispatching a Python lambda per DOM node.
+_FALLBACK_SEL = sv.compile("div[class*='card']")
+
+
+def _soup(html):
+    """Build a soup with the C-backed lxml parser (5-20x faster than
+    the pure-Python html.parser); degrade gracefully if lxml is
+    missing. The soupsieve select() API is identical across backends.
+    """
+    try:
+        return BeautifulSoup(html, "lxml")
+    except FeatureNotFound:
+        return BeautifulSoup(html, "html.parser")
+
+
+def _has_expected_selectors(html, section_key):
+    """True if the raw HTML already contains the section's item nodes.
+
+    Decides whether a plain GET was enough or the page needs a real
+    browser to hydrate first.
+    """
+    return _ITEM_SEL[section_key].select_one(_soup(html)) is not None
+
+
+def parse_monsters(html):
+    if lxml_html is not None:
+        tree = lxml_html.fromstring(html)
+        rows = MONSTER_XPATH(tree)
+        if not rows:
+            rows = MONSTER_FALLBACK_XPATH(tree)
+        # Two tight column passes, then one assembly pass. Each
+        # comprehension stays on a single attribute access pattern,
+        # which keeps the loop bodies small and cache-friendly instead
+        # of interleaving tree reads with dict construction per row.
+        names = [(row.text or "").strip() or "Unknown Monster"
+                 for row in rows]
+        weaknesses = [[alt.strip() for alt in WEAKNESS_XPATH(row)
+                       if alt.strip()]
+                      for row in rows]
+        return [{"type": "monster", "en": name, "jp": "",
+                 "weakness": weak, "materials": [], "notes": ""}
+                for name, weak in zip(names, weaknesses)]
+
+    # BeautifulSoup path, only when lxml isn't installed.
+    soup = _soup(html)
+    rows = _ITEM_SEL["monsters"].select(soup)
+    if not rows:
+        rows = _FALLBACK_SEL.select(soup)
+    results = []
+    for row in rows:
+        name = row.find(text=True, recursive=False)
+        name = name.strip() if name and name.strip() else "Unknown Monster"
+        weaknesses = [
+            img.get("alt", "").strip()
+            for img in row.find_all("img")
+            if "weak" in " ".join(img.get("class") or [])
+        ]
+        results.append({"type": "monster", "en": name, "jp": "",
+                        "weakness": [w for w in weaknesses if w],
+                        "materials": [], "notes": ""})
+    return results
+
+
+def make_parser(section_key, fields_spec):
+    """Build a specialized HTML parser for one section.
+
+    fields_spec is a tuple of (field, sub_selector, default) triples:
+    a compiled sub-selector pulls the matched node's text with the
+    default covering a miss, while None stores the default itself (a
+    callable default, e.g. list, is called per row). The item selector
+    and every triple are baked into the closure, so the per-row loop
+    runs entirely on locals with no CONFIG or module-global lookups.
+    """
+    item_sel = _ITEM_SEL[section_key]
+
+    def parser(html):
+        rows = item_sel.select(_soup(html))
+        results = []
+        append = results.append
+        for row in rows:
+            entry = {}
+            for field, sub_sel, default in fields_spec:
+                if sub_sel is None:
+                    entry[field] = default() if callable(default) else default
+                else:
+                    node = sub_sel.select_one(row)
+                    entry[field] = (node.get_text(strip=True) if node
+                                    else default)
+            append(entry)
+        return results
+
+    return parser
+
+
+parse_weapons = make_parser("weapons", (
+    ("type", None, "weapon"),
+    ("en", _NAME_SEL, "Unknown Weapon"),
+    ("jp", None, ""),
+    ("materials", None, list),
+    ("notes", _DESC_SEL, ""),
+))
+parse_armor = make_parser("armor", (
+    ("type", None, "armor"),
+    ("en", _NAME_SEL, "Unknown Armor"),
+    ("jp", None, ""),
+    ("skills", None, list),
+    ("materials", None, list),
+    ("notes", _DESC_SEL, ""),
+))
+parse_skills = make_parser("skills", (
+    ("type", None, "skill"),
+    ("en", _NAME_SEL, "Unknown Skill"),
+    ("jp", None, ""),
+    ("description", _DESC_SEL, ""),
+    ("notes", None, ""),
+))
+parse_items = make_parser("items", (
+    ("type", None, "item"),
+    ("en", _NAME_SEL, "Unknown Item"),
+    ("jp", None, ""),
+    ("description", _DESC_SEL, ""),
+    ("notes", None, ""),
+))
+
+
+# Rendered-HTML cache for debug iteration: re-running the scraper
+# against unchanged pages skips the browser entirely within the TTL.
+CACHE_DIR = Path.home() / ".cache" / "mhn-scraper"
+CACHE_TTL_SECONDS = 3600
+
+_SECTION_META = {
+    "monsters": ("monster", "Unknown Monster"),
+    "weapons": ("weapon", "Unknown Weapon"),
+    "armor": ("armor", "Unknown Armor"),
+    "skills": ("skill", "Unknown Skill"),
+    "items": ("item", "Unknown Item"),
+}
+
+
+def entries_from_raw(section_key, raw_rows):
+    """Shape the in-page extractor's rows into the same dicts the
+    HTML-string parsers produce, so both transports emit one format."""
+    type_name, unknown = _SECTION_META[section_key]
+    results = []
+    for raw in raw_rows:
+        entry = {"type": type_name, "en": raw["name"] or unknown, "jp": ""}
+        if section_key == "monsters":
+            entry.update(weakness=raw["weaknesses"], materials=[], notes="")
+        elif section_key == "weapons":
+            entry.update(materials=[], notes=raw["description"])
+        elif section_key == "armor":
+            entry.update(skills=[], materials=[], notes=raw["description"])
+        else:
+            entry.update(description=raw["description"], notes="")
+        results.append(entry)
+    return results
+
+
+def setup_logging(mode="normal"):
+    """Configure root logging once per process; see MHNScraper.__init__."""
+    logging.basicConfig(
+        level=logging.DEBUG if mode == "debug" else logging.INFO,
+        format="%(asctime)s %(levelname)s %(message)s",
+    )
+
+
+class MHNScraper:
+    """Drives the browser over all sections and writes the JSON output."""
+
+    def __init__(self, mode="normal", use_cache=True):
+        self.mode = mode
+        # The cache serves the debug iteration loop only; production
+        # runs always hit the live site.
+        self.use_cache = use_cache and mode == "debug"
+        # Mode never changes after construction, so resolve the config
+        # lookup chain once instead of on every section.
+        self.wait_ms = CONFIG["timeouts"][
+            "debug" if mode == "debug" else "normal"]
+        self.data = {}
+        self.report = {}
+        # Handler/format wiring belongs to the process entry point
+        # (setup_logging); constructing a scraper only grabs the named
+        # logger, so tests can build many instances without stacking
+        # root-logger configuration.
+        self.logger = logging.getLogger("mhn_scraper")
+        self.logger.setLevel(
+            logging.DEBUG if mode == "debug" else logging.INFO)
+
+    async def _dismiss_consent(self, context):
+        """Dismiss the consent popup once for the whole context.
+
+        The consent cookie is context-wide, so one page pays the cost
+        up front and every scraping page starts clean. Fully
+        event-driven: wait for the button to show, click, wait for it
+        to detach — no fixed sleeps, and a site with no popup costs at
+        most the short visibility timeout.
+        """
+        page = await context.new_page()
+        try:
+            await page.goto(CONFIG["base_url"], wait_until="domcontentloaded")
+            consent_btn = page.get_by_role("button", name="Consent", exact=True)
+            try:
+                await consent_btn.wait_for(state="visible", timeout=1500)
+                await consent_btn.click()
+                await consent_btn.wait_for(state="detached", timeout=2000)
+            except PlaywrightTimeout:
+                self.logger.debug("No consent popup to dismiss")
+        finally:
+            await page.close()
+
+    def _save_debug_html(self, section_key, content):
+        out_dir = Path(CONFIG["output_dir"])
+        out_dir.mkdir(parents=True, exist_ok=True)
+        debug_file = out_dir / f"debug_{section_key}.html"
+        debug_file.write_bytes(content.encode("utf-8"))
+        self.logger.info("Saved debug HTML to %s", debug_file)
+
+    def _cache_path(self, url):
+        digest = hashlib.sha1(url.encode("utf-8")).hexdigest()
+        return CACHE_DIR / f"{digest}.html"
+
+    def _read_cache(self, url):
+        """Return cached HTML for url, or None if disabled or stale."""
+        if not self.use_cache:
+            return None
+        path = self._cache_path(url)
+        try:
+            if time.time() - path.stat().st_mtime <= CACHE_TTL_SECONDS:
+                return path.read_text(encoding="utf-8")
+        except OSError:
+            pass
+        return None
+
+    def _write_cache(self, url, content):
+        if not self.use_cache:
+            return
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        self._cache_path(url).write_bytes(content.encode("utf-8"))
+
+    async def fetch_via_http(self, section_key, parser_func, client):
+        """Try to scrape one section with a plain GET, no browser.
+
+        Returns True on success. A response whose HTML lacks the
+        section's item nodes (the SPA shell before hydration) is a
+        miss, not an error; the caller falls back to Playwright.
+        """
+        section_cfg = CONFIG["sections"][section_key]
+        url = CONFIG["base_url"] + section_cfg["url_suffix"]
+        resp = await client.get(url)
+        resp.raise_for_status()
+        if not _has_expected_selectors(resp.text, section_key):
+            self.logger.debug("%s not present in static HTML; needs a "
+                              "browser", section_key)
+            return False
+        items = parser_func(resp.text)
+        self.data[section_key] = items
+        self.report[section_key] = {
+            "url": url, "count": len(items), "status": "ok (http)"}
+        self.logger.info("Parsed %d %s over plain HTTP", len(items),
+                         section_key)
+        return True
+
+    async def fetch_and_process(self, section_key, parser_func, context):
+        """Scrape one section on its own page; writes only its own
+        self.data/self.report keys, so concurrent tasks need no lock."""
+        # One subscript walk instead of three; everything below reads
+        # the section config through a local.
+        section_cfg = CONFIG["sections"][section_key]
+        url = CONFIG["base_url"] + section_cfg["url_suffix"]
+
+        cached = self._read_cache(url)
+        if cached is not None:
+            items = parser_func(cached)
+            self.data[section_key] = items
+            self.report[section_key] = {
+                "url": url, "count": len(items), "status": "ok (cache)"}
+            self.logger.info("Parsed %d %s from cache", len(items),
+                             section_key)
+            return
+
+        self.logger.info("Fetching %s from %s", section_key, url)
+        page = await context.new_page()
+        try:
+            # domcontentloaded fires as soon as the shell document is
+            # parsed; waiting for the section container then resumes the
+            # moment the SPA has rendered, rather than after networkidle
+            # (which analytics beacons can hold off forever) plus a
+            # fixed sleep sized for the slowest case.
+            await page.goto(url, wait_until="domcontentloaded")
+            container = section_cfg["container_selector"]
+            try:
+                # attached, not the default visible: with stylesheets
+                # aborted by the blocking route, visibility is exactly
+                # the property we can't rely on.
+                await page.wait_for_selector(container, state="attached",
+                                             timeout=self.wait_ms)
+            except PlaywrightTimeout:
+                self.logger.debug("%s container never appeared; parsing "
+                                  "whatever rendered", section_key)
+
+            if self.mode == "debug":
+                content = await page.content()
+                self._save_debug_html(section_key, content)
+                self._write_cache(url, content)
+
+            # Structured extraction straight from the live DOM: no
+            # content() serialization, no Python-side re-parse. The
+            # HTML-string parsers stay for the HTTP path and for
+            # offline runs against saved debug pages.
+            raw = await page.eval_on_selector_all(
+                section_cfg["item_selector"], _JS_EXTRACT)
+            items = entries_from_raw(section_key, raw)
+            self.data[section_key] = items
+            self.report[section_key] = {
+                "url": url, "count": len(items), "status": "ok"}
+            self.logger.info("Parsed %d %s", len(items), section_key)
+        finally:
+            await page.close()
+
+    async def run(self):
+        """Scrape all five sections concurrently in one browser.
+
+        The work is network- and render-bound, so running sections as
+        gathered tasks (each on its own context/page) brings total wall
+        time down to roughly the slowest section, and the browser is
+        launched once instead of per section.
+        """
+        sections = [
+            ("monsters", parse_monsters),
+            ("weapons", parse_weapons),
+            ("armor", parse_armor),
+            ("skills", parse_skills),
+            ("items", parse_items),
+        ]
+        # Cheapest transport first: a shared HTTP/2 client probes every
+        # section with a plain GET, and Chromium is launched only for
+        # the sections whose static HTML turns out to be an unhydrated
+        # SPA shell.
+        async with httpx.AsyncClient(http2=True, timeout=15,
+                                     follow_redirects=True) as client:
+            probes = await asyncio.gather(
+                *[self.fetch_via_http(key, fn, client)
+                  for key, fn in sections],
+                return_exceptions=True,
+            )
+        sections = [pair for pair, ok in zip(sections, probes)
+                    if ok is not True]
+        if not sections:
+            self._write_output()
+            return
+        async with async_playwright() as p:
+            browser = await p.chromium.launch(headless=True)
+            try:
+                # One shared context: pages are much cheaper than
+                # contexts, and the consent dismissal below covers
+                # every section page through the shared cookie jar.
+                context = await browser.new_context()
+                # Images, media, fonts and CSS are dead weight for a
+                # scrape that only reads the DOM; aborting them at the
+                # route layer cuts most of the transfer and render work.
+                # Debug mode keeps them so the saved HTML stays true to
+                # what a browser shows.
+                if self.mode != "debug":
+                    blocked = {"image", "media", "font", "stylesheet"}
+                    await context.route(
+                        "**/*",
+                        lambda route: route.abort()
+                        if route.request.resource_type in blocked
+                        else route.continue_())
+                await self._dismiss_consent(context)
+                results = await asyncio.gather(
+                    *[self.fetch_and_process(key, fn, context)
+                      for key, fn in sections],
+                    return_exceptions=True,
+                )
+                for (key, _), result in zip(sections, results):
+                    if isinstance(result, BaseException):
+                        self.logger.error("Section %s failed: %s", key, result)
+                        self.data.setdefault(key, [])
+                        self.report[key] = {
+                            "url": "", "count": 0, "status": f"error: {result}"}
+            finally:
+                await browser.close()
+        self._write_output()
+
+    def _write_output(self):
+        out_dir = Path(CONFIG["output_dir"])
+        out_dir.mkdir(parents=True, exist_ok=True)
+
+        # orjson emits UTF-8 bytes straight from native code; one
+        # write_bytes per file replaces the stdlib pretty-printer
+        # trickling through a TextIOWrapper. The outputs are machine-
+        # consumed, so production writes stay compact — smaller files,
+        # no indent pass — and debug mode opts into readability.
+        option = orjson.OPT_NON_STR_KEYS
+        if self.mode == "debug":
+            option |= orjson.OPT_INDENT_2
+
+        def write_section(key, items):
+            # One section's payload resident per worker; nothing holds
+            # the whole document in serialized form.
+            (out_dir / f"mhnow_{key}.json").write_bytes(
+                orjson.dumps(items, option=option))
+
+        def write_aggregate():
+            # Streams item by item, so its peak memory is one entry
+            # regardless of scrape size. Compact on purpose: it's the
+            # machine-read file, and per-item encodes skip the indent.
+            with open(out_dir / "mhnow_data_all.json", "wb") as f:
+                f.write(b"{")
+                for i, (key, items) in enumerate(self.data.items()):
+                    if i:
+                        f.write(b",")
+                    f.write(orjson.dumps(key))
+                    f.write(b":[")
+                    for j, item in enumerate(items):
+                        if j:
+                            f.write(b",")
+                        f.write(orjson.dumps(item))
+                    f.write(b"]")
+                f.write(b"}")
+
+        def write_report():
+            (out_dir / "scrape_report.json").write_bytes(
+                orjson.dumps(self.report, option=option))
+
+        # The files are independent, write() releases the GIL, and
+        # orjson encoding runs inside the workers, so the seven files
+        # overlap instead of queueing behind one another.
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            futures = [pool.submit(write_section, key, items)
+                       for key, items in self.data.items()]
+            futures.append(pool.submit(write_aggregate))
+            futures.append(pool.submit(write_report))
+            for future in futures:
+                future.result()
+        self.logger.info("Wrote %d output files to %s",
+                         2 + len(self.data), out_dir)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Scrape mhn.quest via rendered HTML + BeautifulSoup")
+    parser.add_argument("--mode", choices=["normal", "debug"], default="normal",
+                        help="debug saves page HTML and waits longer")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="ignore cached page HTML in debug mode")
+    args = parser.parse_args()
+    setup_logging(args.mode)
+    scraper = MHNScraper(mode=args.mode, use_cache=not args.no_cache)
+    asyncio.run(scraper.run())
+
+
+if __name__ == "__main__":
+    main()
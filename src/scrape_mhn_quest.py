@@ -0,0 +1,534 @@
+#!/usr/bin/env python3
+"""Scrape game data from mhn.quest into JSON files for RAG/LLM use.
+
+The site is a single-page app, so each section is rendered client-side;
+we drive a headless Chromium via Playwright, wait for the section to
+hydrate, and pull the entries out of the live DOM.
+"""
+
+import argparse
+import asyncio
+import gzip
+import logging
+import json
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+
+import aiofiles
+import httpx
+import orjson
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+from playwright.async_api import async_playwright
+
+from _parsers import build_entries
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class ScraperConfig:
+    """Where to scrape, how long to wait, and what to look for."""
+
+    base_url: str = "https://mhn.quest"
+    output_dir: Path = Path("output")
+    # Persistent Chromium profile: cache, compiled JS and service-worker
+    # state survive between runs, so only the first run starts cold.
+    profile_dir: Path = Path(".pw-profile")
+    # Upper bound on waiting for the SPA to hydrate a section; the
+    # scrape continues as soon as items actually appear.
+    hydrate_timeout: int = 15000
+    sections: dict = field(default_factory=lambda: {
+        "monsters": "/#/monster",
+        "weapons": "/#/weapon",
+        "armor": "/#/armor",
+        "skills": "/#/skill",
+        "items": "/#/item",
+    })
+    # JSON bundles the SPA fetches on load, observed via the debug-mode
+    # network log; hitting them directly skips the browser entirely.
+    data_endpoints: dict = field(default_factory=lambda: {
+        "monsters": "/data/monsters.json",
+        "weapons": "/data/weapons.json",
+        "armor": "/data/armor.json",
+        "skills": "/data/skills.json",
+        "items": "/data/items.json",
+    })
+    # Selector alternatives are comma-joined CSS and go to querySelector
+    # as-is, which returns the first match in *document* order, not
+    # selector order. Keep the most specific class first and generic
+    # tags (h3, p) last so a generic hit can't shadow the right one.
+    selectors: dict = field(default_factory=lambda: {
+        "monsters": {
+            "item": ".monster-card, .card, li.monster",
+            "name_en": ".name-en, .card-title, h3",
+            "name_jp": ".name-jp, .card-subtitle, .jp",
+            "weakness": ".weakness img, .weak, .element",
+            "materials": ".materials li, .material, .drop",
+        },
+        "weapons": {
+            "item": ".weapon-card, .card, li.weapon",
+            "name_en": ".name-en, .card-title, h3",
+            "name_jp": ".name-jp, .card-subtitle, .jp",
+            "weapon_type": ".weapon-type, .type, .category",
+            "materials": ".materials li, .material, .drop",
+        },
+        "armor": {
+            "item": ".armor-card, .card, li.armor",
+            "name_en": ".name-en, .card-title, h3",
+            "name_jp": ".name-jp, .card-subtitle, .jp",
+            "skills": ".skills li, .skill, .ability",
+            "materials": ".materials li, .material, .drop",
+        },
+        "skills": {
+            "item": ".skill-card, .card, li.skill",
+            "name_en": ".name-en, .card-title, h3",
+            "name_jp": ".name-jp, .card-subtitle, .jp",
+            "description": ".description, .card-text, p",
+        },
+        "items": {
+            "item": ".item-card, .card, li.item",
+            "name_en": ".name-en, .card-title, h3",
+            "name_jp": ".name-jp, .card-subtitle, .jp",
+            "description": ".description, .card-text, p",
+        },
+    })
+
+
+# One spec drives both extraction paths: which selector fields hold a
+# single text value vs a list, per section. The entry class for each
+# section is picked in _parsers.entry_from_json.
+PARSE_SPEC = {
+    "monsters": {"text": ("name_en", "name_jp"),
+                 "lists": ("weakness", "materials")},
+    "weapons": {"text": ("name_en", "name_jp", "weapon_type"),
+                "lists": ("materials",)},
+    "armor": {"text": ("name_en", "name_jp"),
+              "lists": ("skills", "materials")},
+    "skills": {"text": ("name_en", "name_jp", "description"),
+               "lists": ()},
+    "items": {"text": ("name_en", "name_jp", "description"),
+              "lists": ()},
+}
+
+# Runs in-page: one evaluate call does all DOM traversal for a section
+# and returns plain dicts, instead of one CDP round-trip per field.
+_JS_EXTRACT = """
+(args) => {
+  const { itemSel, textFields, listFields } = args;
+  return Array.from(document.querySelectorAll(itemSel)).map(el => {
+    const row = {};
+    for (const [field, sel] of Object.entries(textFields)) {
+      const sub = el.querySelector(sel);
+      row[field] = sub && sub.textContent ? sub.textContent.trim() : "";
+    }
+    for (const [field, sel] of Object.entries(listFields)) {
+      row[field] = Array.from(el.querySelectorAll(sel))
+        .map(e => (e.textContent || "").trim())
+        .filter(Boolean);
+    }
+    return row;
+  });
+}
+"""
+
+
+async def block_heavy_resources(context):
+    """Abort image/font/media/stylesheet requests on a context.
+
+    Registered once by whoever creates the context, never inside the
+    per-scrape path: Playwright stacks duplicate route handlers rather
+    than replacing them, and the keep-browser daemon reuses one warm
+    context across many scrapes.
+    """
+    blocked = {"image", "font", "media", "stylesheet"}
+    await context.route(
+        "**/*",
+        lambda route: route.abort()
+        if route.request.resource_type in blocked
+        else route.continue_())
+
+
+class MHNQuestScraper:
+    """Scrapes every configured section and writes JSON to ``output_dir``."""
+
+    def __init__(self, config=None, mode="normal", pretty=False):
+        self.config = config or ScraperConfig()
+        self.mode = mode
+        # Output is machine-consumed; compact gzipped JSON is the
+        # default and indented plain files are opt-in via --pretty.
+        self.pretty = pretty
+        self.data = {}
+        self.report = {}
+        self.scraped_at = None
+        # Output paths are fixed by the config; build them once here
+        # instead of re-deriving them in the save loop.
+        suffix = ".json" if pretty else ".json.gz"
+        self._section_files = {
+            name: self.config.output_dir / f"mhnow_{name}{suffix}"
+            for name in self.config.sections}
+        self._combined_file = self.config.output_dir / f"mhnow_data_all{suffix}"
+        self._report_file = self.config.output_dir / "scrape_report.json"
+
+    def _start_run(self):
+        self.scraped_at = datetime.now().isoformat()
+        self.config.output_dir.mkdir(parents=True, exist_ok=True)
+
+    # ------------------------------------------------------------------
+    # DOM extraction helpers
+    # ------------------------------------------------------------------
+
+    async def _extract_text(self, element, selector):
+        """Return the first matched text in one in-page call.
+
+        Comma-separated alternatives are valid CSS, so the whole lookup
+        is a single querySelector; the match is the first in document
+        order, which is why each selector lists the most specific class
+        first.
+        """
+        return await element.evaluate(
+            "(el, sel) => { const sub = el.querySelector(sel);"
+            " return sub ? (sub.textContent || '').trim() : ''; }",
+            selector)
+
+    async def _extract_list(self, element, selector):
+        """Return all non-empty matched texts in one in-page call."""
+        return await element.eval_on_selector_all(
+            selector,
+            "els => els.map(e => (e.textContent || '').trim())"
+            ".filter(Boolean)")
+
+    # ------------------------------------------------------------------
+    # Element-by-element fallback parser
+    # ------------------------------------------------------------------
+
+    async def _parse_generic(self, page, selectors, section_name):
+        """Walk items one element at a time, driven by PARSE_SPEC.
+
+        The five per-section parsers were structurally identical; one
+        shared loop means every extraction improvement lands for all
+        sections at once.
+        """
+        spec = PARSE_SPEC[section_name]
+        rows = []
+        for element in await page.query_selector_all(selectors["item"]):
+            row = {}
+            for field_name in spec["text"]:
+                row[field_name] = await self._extract_text(
+                    element, selectors[field_name])
+            for field_name in spec["lists"]:
+                row[field_name] = await self._extract_list(
+                    element, selectors[field_name])
+            rows.append(row)
+        return build_entries(section_name, rows)
+
+    # ------------------------------------------------------------------
+    # Scraping
+    # ------------------------------------------------------------------
+
+    async def _scrape_section(self, page, section_name):
+        url = self.config.base_url + self.config.sections[section_name]
+        selectors = self.config.selectors[section_name]
+        self.report[section_name] = {"url": url, "count": 0, "errors": []}
+        logger.info("Scraping %s from %s", section_name, url)
+
+        if self.mode == "debug":
+            # Log every network call so data endpoints can be identified
+            # and added to ScraperConfig.data_endpoints.
+            page.on("requestfinished",
+                    lambda request: logger.debug(
+                        "network: %s %s", request.method, request.url))
+
+        await page.goto(url)
+        try:
+            await page.wait_for_function(
+                f"document.querySelectorAll({json.dumps(selectors['item'])})"
+                ".length > 0",
+                timeout=self.config.hydrate_timeout)
+        except PlaywrightTimeoutError:
+            logger.warning("No %s items appeared within %dms",
+                           section_name, self.config.hydrate_timeout)
+        # Short settle to absorb any late render commits after the
+        # first items land.
+        await page.wait_for_timeout(200)
+
+        if self.mode == "debug":
+            html_content = await page.content()
+            debug_file = self.config.output_dir / f"debug_{section_name}.html"
+            # Multi-MB dumps would otherwise block the loop while the
+            # other sections are mid-scrape.
+            async with aiofiles.open(debug_file, "wb") as f:
+                await f.write(html_content.encode("utf-8"))
+            logger.info("Saved debug HTML to %s", debug_file)
+
+        entries = await self._extract_items(page, section_name, selectors)
+        self.data[section_name] = [entry.to_dict() for entry in entries]
+        self.report[section_name]["count"] = len(entries)
+        logger.info("Found %d %s", len(entries), section_name)
+
+    async def _extract_items(self, page, section_name, selectors):
+        """Pull all entries for a section out of the live DOM.
+
+        The fast path is a single ``page.evaluate`` that returns every
+        row as a dict; if it comes back empty (selector drift, blocked
+        eval) we fall back to walking elements one by one.
+        """
+        spec = PARSE_SPEC[section_name]
+        args = {
+            "itemSel": selectors["item"],
+            "textFields": {f: selectors[f] for f in spec["text"]},
+            "listFields": {f: selectors[f] for f in spec["lists"]},
+        }
+        rows = await page.evaluate(_JS_EXTRACT, args)
+        if rows:
+            return build_entries(section_name, rows)
+
+        return await self._parse_generic(page, selectors, section_name)
+
+    async def scrape_all(self):
+        """Scrape all sections concurrently, one page per section.
+
+        Pages share a single browser context, which is far cheaper than
+        extra browsers; the workload is I/O-bound so total wall time is
+        roughly the slowest section rather than the sum of all five.
+        """
+        self._start_run()
+        async with async_playwright() as p:
+            context = await p.chromium.launch_persistent_context(
+                str(self.config.profile_dir), headless=True)
+            try:
+                if self.mode != "debug":
+                    await block_heavy_resources(context)
+                await self._scrape_sections(context)
+            finally:
+                await context.close()
+
+    async def _scrape_sections(self, context):
+        """Run every section concurrently on a (possibly warm) context.
+
+        Safe to call repeatedly on the same context; resource blocking
+        is the context owner's job (see block_heavy_resources).
+        """
+        section_names = list(self.config.sections)
+        pages = [await context.new_page() for _ in section_names]
+        try:
+            results = await asyncio.gather(
+                *[self._scrape_section(page, name)
+                  for page, name in zip(pages, section_names)],
+                return_exceptions=True,
+            )
+            for name, result in zip(section_names, results):
+                if isinstance(result, BaseException):
+                    logger.error("Section %s failed: %s", name, result)
+                    report = self.report.setdefault(
+                        name, {"url": "", "count": 0, "errors": []})
+                    report["errors"].append(str(result))
+                    self.data.setdefault(name, [])
+        finally:
+            for page in pages:
+                await page.close()
+
+    # ------------------------------------------------------------------
+    # Output
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _write_bytes_atomic(path, payload, compress=False):
+        # Write-then-rename so downstream consumers never observe a
+        # half-written file. compresslevel=3 trades a little size for
+        # much less CPU than the gzip default.
+        tmp = path.with_name(path.name + ".tmp")
+        if compress:
+            with gzip.open(tmp, "wb", compresslevel=3) as f:
+                f.write(payload)
+        else:
+            tmp.write_bytes(payload)
+        tmp.replace(path)
+
+    async def _write_file(self, path, payload, compress=False):
+        await asyncio.to_thread(
+            self._write_bytes_atomic, path, payload, compress)
+        logger.info("Wrote %s", path)
+
+    async def _write_combined(self, section_payloads):
+        """Splice already-serialized section arrays into one big array.
+
+        Each section's bytes are reused with their outer brackets
+        stripped, so the combined file costs no re-encoding and no
+        concatenated in-memory copy of all entries.
+        """
+        await asyncio.to_thread(self._write_combined_sync, section_payloads)
+        logger.info("Wrote %s", self._combined_file)
+
+    def _write_combined_sync(self, section_payloads):
+        tmp = self._combined_file.with_name(self._combined_file.name + ".tmp")
+        opener = (open(tmp, "wb") if self.pretty
+                  else gzip.open(tmp, "wb", compresslevel=3))
+        with opener as f:
+            f.write(b"[")
+            first = True
+            for payload in section_payloads.values():
+                body = payload[1:-1]
+                if not body.strip():
+                    continue
+                if not first:
+                    f.write(b",")
+                f.write(body)
+                first = False
+            f.write(b"]")
+        tmp.replace(self._combined_file)
+
+    async def save_data(self):
+        # One serialization per section; both the per-section file and
+        # the combined file are written from these bytes.
+        option = orjson.OPT_INDENT_2 if self.pretty else 0
+        section_payloads = {
+            name: orjson.dumps(entries, option=option)
+            for name, entries in self.data.items()
+        }
+
+        writes = [
+            self._write_file(self._section_files[name], payload,
+                             compress=not self.pretty)
+            for name, payload in section_payloads.items()
+        ]
+        writes.append(self._write_combined(section_payloads))
+
+        report = {"scraped_at": self.scraped_at, "sections": self.report}
+        writes.append(self._write_file(
+            self._report_file, orjson.dumps(report, option=orjson.OPT_INDENT_2)))
+
+        await asyncio.gather(*writes)
+
+
+class HttpScraper(MHNQuestScraper):
+    """Fetches the SPA's JSON data endpoints directly, no browser.
+
+    An order of magnitude faster than rendering the site, and avoids
+    Chromium's memory footprint entirely.  All five requests multiplex
+    over one HTTP/2 connection, so only a single TCP+TLS handshake is
+    paid.  Raises on any non-200 or decode failure so the caller can
+    fall back to the browser path.
+    """
+
+    async def scrape_all(self):
+        self._start_run()
+        section_names = list(self.config.sections)
+        async with httpx.AsyncClient(http2=True, timeout=30) as client:
+            await asyncio.gather(
+                *[self._fetch_section(client, name) for name in section_names])
+
+    async def _fetch_section(self, client, section_name):
+        url = self.config.base_url + self.config.data_endpoints[section_name]
+        self.report[section_name] = {"url": url, "count": 0, "errors": []}
+        logger.info("Fetching %s from %s", section_name, url)
+
+        response = await client.get(url)
+        response.raise_for_status()
+        # Decode off the loop so a large bundle doesn't stall the
+        # other in-flight sections.
+        payload = await asyncio.to_thread(orjson.loads, response.content)
+        # The endpoints are educated guesses (see ScraperConfig); a 200
+        # carrying e.g. {"data": [...]} must fail like a decode error so
+        # the caller falls back to the browser instead of crashing
+        # inside build_entries.
+        if not isinstance(payload, list) or not all(
+                isinstance(row, dict) for row in payload):
+            raise ValueError(
+                f"{url} did not return a JSON list of objects")
+
+        entries = build_entries(section_name, payload)
+        self.data[section_name] = [entry.to_dict() for entry in entries]
+        self.report[section_name]["count"] = len(entries)
+        logger.info("Found %d %s", len(entries), section_name)
+
+
+async def serve_keep_browser(mode, pretty=False, host="127.0.0.1", port=8377):
+    """Daemon mode: keep a warm persistent context and scrape on demand.
+
+    Line protocol on a local socket: ``scrape`` runs a full scrape and
+    save on the already-warm profile, ``quit`` closes the connection.
+    Repeated invocations skip browser start-up and cache warming
+    entirely (e.g. ``echo scrape | nc 127.0.0.1 8377``).
+    """
+    config = ScraperConfig()
+    async with async_playwright() as p:
+        context = await p.chromium.launch_persistent_context(
+            str(config.profile_dir), headless=True)
+        if mode != "debug":
+            await block_heavy_resources(context)
+
+        async def handle(reader, writer):
+            while line := await reader.readline():
+                command = line.decode().strip()
+                if command == "scrape":
+                    scraper = MHNQuestScraper(mode=mode, pretty=pretty)
+                    try:
+                        scraper._start_run()
+                        await scraper._scrape_sections(context)
+                        await scraper.save_data()
+                        writer.write(b"ok\n")
+                    except Exception as exc:
+                        logger.exception("Scrape failed")
+                        writer.write(f"error: {exc}\n".encode())
+                elif command == "quit":
+                    break
+                else:
+                    writer.write(b"unknown command\n")
+                await writer.drain()
+            writer.close()
+
+        server = await asyncio.start_server(handle, host, port)
+        logger.info("Keeping browser warm, listening on %s:%d", host, port)
+        try:
+            async with server:
+                await server.serve_forever()
+        finally:
+            await context.close()
+
+
+async def main_async(mode, pretty=False):
+    scraper = HttpScraper(mode=mode, pretty=pretty)
+    try:
+        await scraper.scrape_all()
+    except (httpx.HTTPError, ValueError) as exc:
+        # ValueError covers both orjson.JSONDecodeError and the payload
+        # shape check in HttpScraper._fetch_section.
+        logger.warning(
+            "Data endpoints unavailable (%s); falling back to browser scrape",
+            exc)
+        scraper = MHNQuestScraper(mode=mode, pretty=pretty)
+        await scraper.scrape_all()
+    await scraper.save_data()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Scrape mhn.quest game data")
+    parser.add_argument("--mode", choices=["normal", "debug"], default="normal",
+                        help="debug saves page HTML and waits longer")
+    parser.add_argument("--keep-browser", action="store_true",
+                        help="stay resident and scrape on demand via a "
+                             "local socket, reusing the warm browser")
+    parser.add_argument("--pretty", action="store_true",
+                        help="write indented uncompressed .json instead "
+                             "of compact .json.gz")
+    args = parser.parse_args()
+    try:
+        # libuv-backed event loop: cheaper syscall/callback dispatch for
+        # the CDP-heavy await traffic. Optional; stdlib loop works too.
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
+    logging.basicConfig(
+        level=logging.DEBUG if args.mode == "debug" else logging.INFO,
+        format="%(asctime)s %(levelname)s %(message)s",
+    )
+    if args.keep_browser:
+        asyncio.run(serve_keep_browser(args.mode, args.pretty))
+    else:
+        asyncio.run(main_async(args.mode, args.pretty))
+
+
+if __name__ == "__main__":
+    main()
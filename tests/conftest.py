@@ -0,0 +1,16 @@
+import logging
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+
+@pytest.fixture(autouse=True, scope="session")
+def _configure_logging():
+    # Mirrors the scrapers' setup_logging entry-point hook: wire the
+    # root logger once for the whole test session instead of per
+    # scraper instance.
+    logging.basicConfig(level=logging.INFO,
+                        format="%(asctime)s %(levelname)s %(message)s")
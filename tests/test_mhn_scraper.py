@@ -0,0 +1,68 @@
+"""Smoke tests for the BeautifulSoup-based scraper variant."""
+
+import json
+
+import pytest
+
+pytest.importorskip("playwright")
+pytest.importorskip("bs4")
+
+from mhn_scraper import CONFIG, MHNScraper, parse_monsters, parse_skills
+
+MONSTER_HTML = """
+<html><body>
+<div class="monster-card">Rathalos<img class="icon weak" alt="Flash"></div>
+<div class="monster-card">Rathian</div>
+</body></html>
+"""
+
+
+def test_smoke_config_and_setup():
+    scraper = MHNScraper(mode="debug")
+    assert scraper.mode == "debug"
+    assert set(CONFIG["sections"]) == {
+        "monsters", "weapons", "armor", "skills", "items"}
+    assert scraper.wait_ms == CONFIG["timeouts"]["debug"]
+
+
+def test_parse_monsters_extracts_names_and_weaknesses():
+    items = parse_monsters(MONSTER_HTML)
+    assert [item["en"] for item in items] == ["Rathalos", "Rathian"]
+    assert items[0]["weakness"] == ["Flash"]
+    assert items[1]["weakness"] == []
+
+
+def test_parse_monsters_ignores_card_grid_container():
+    # A substring class match would also treat the .card-grid wrapper
+    # as a row, yielding a phantom monster that aggregates every
+    # child's weaknesses.
+    html = ('<div class="card-grid">'
+            '<div class="card">Mon1<img class="weak" alt="Fire"></div>'
+            '<div class="card">Mon2<img class="weak" alt="Water"></div>'
+            '</div>')
+    items = parse_monsters(html)
+    assert [item["en"] for item in items] == ["Mon1", "Mon2"]
+    assert [item["weakness"] for item in items] == [["Fire"], ["Water"]]
+
+
+def test_parse_skills_reads_name_and_description():
+    html = ('<div class="skill-card"><h3>Focus</h3>'
+            '<p>Gauge fills faster</p></div>')
+    items = parse_skills(html)
+    assert items == [{"type": "skill", "en": "Focus", "jp": "",
+                      "description": "Gauge fills faster", "notes": ""}]
+
+
+def test_integration_flow_dry_run(tmp_path, monkeypatch):
+    # Exercise the output stage without a browser: inject parsed data
+    # and make sure the files land where a consumer would look.
+    monkeypatch.setitem(CONFIG, "output_dir", str(tmp_path))
+    scraper = MHNScraper()
+    scraper.data = {"monsters": [{"type": "monster", "en": "Rathalos"}]}
+    scraper.report = {"monsters": {"url": "", "count": 1, "status": "ok"}}
+    scraper._write_output()
+
+    written = json.loads((tmp_path / "mhnow_monsters.json").read_text())
+    assert written[0]["en"] == "Rathalos"
+    combined = json.loads((tmp_path / "mhnow_data_all.json").read_text())
+    assert combined["monsters"] == written
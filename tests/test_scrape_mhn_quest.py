@@ -0,0 +1,92 @@
+"""Tests for the mhn.quest scraper that don't need a real browser."""
+
+import asyncio
+import re
+
+import pytest
+
+pytest.importorskip("playwright")
+
+from _parsers import Monster, Skill
+from scrape_mhn_quest import MHNQuestScraper
+
+_DIV_RE = re.compile(r'<div class="([^"]+)">([^<]+)</div>')
+
+
+class MockElement:
+    """Stands in for a Playwright element over a tiny HTML snippet.
+
+    Only understands flat ``<div class="...">text</div>`` children and
+    comma-separated class selectors like ``.name-en, h3``; the in-page
+    JS the extraction helpers ship is emulated semantically (first
+    match for ``evaluate``, all matches for ``eval_on_selector_all``).
+    """
+
+    def __init__(self, html="", text=""):
+        self._text = text
+        self._children = self._parse_html(html) if html else {}
+
+    def _parse_html(self, html):
+        children = {}
+        for cls, text in _DIV_RE.findall(html):
+            children.setdefault(cls, []).append(MockElement(text=text))
+        return children
+
+    async def text_content(self):
+        return self._text
+
+    async def query_selector(self, selector):
+        matches = await self.query_selector_all(selector)
+        return matches[0] if matches else None
+
+    async def query_selector_all(self, selector):
+        matches = []
+        for sel in selector.split(","):
+            matches.extend(self._children.get(sel.strip().lstrip("."), []))
+        return matches
+
+    async def evaluate(self, js, selector):
+        match = await self.query_selector(selector)
+        return match._text.strip() if match else ""
+
+    async def eval_on_selector_all(self, selector, js):
+        return [m._text.strip()
+                for m in await self.query_selector_all(selector)
+                if m._text.strip()]
+
+
+def test_to_dict_drops_empty_fields():
+    monster = Monster(en="Rathalos", weakness=["flash"])
+    assert monster.to_dict() == {
+        "type": "monster", "en": "Rathalos", "weakness": ["flash"]}
+
+
+def test_to_dict_keeps_populated_fields():
+    skill = Skill(en="Focus", jp="集中", description="Fills gauges faster")
+    data = skill.to_dict()
+    assert data["jp"] == "集中"
+    assert data["description"] == "Fills gauges faster"
+
+
+def test_extract_text_uses_first_matching_alternative():
+    scraper = MHNQuestScraper()
+    element = MockElement('<div class="card-title">Rathalos</div>')
+    text = asyncio.run(
+        scraper._extract_text(element, ".name-en, .card-title, h3"))
+    assert text == "Rathalos"
+
+
+def test_extract_text_returns_empty_when_nothing_matches():
+    scraper = MHNQuestScraper()
+    element = MockElement('<div class="unrelated">x</div>')
+    text = asyncio.run(scraper._extract_text(element, ".name-en, .card-title"))
+    assert text == ""
+
+
+def test_extract_list_collects_all_matches():
+    scraper = MHNQuestScraper()
+    element = MockElement(
+        '<div class="weak">Fire</div><div class="weak">Thunder</div>')
+    values = asyncio.run(
+        scraper._extract_list(element, ".weakness img, .weak"))
+    assert values == ["Fire", "Thunder"]